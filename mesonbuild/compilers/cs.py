@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os.path, subprocess
-import textwrap
 import typing as T
+from pathlib import Path
 
 from ..mesonlib import EnvironmentException
 from ..linkers import RSPFileSyntax
@@ -26,19 +27,43 @@ if T.TYPE_CHECKING:
     from ..envconfig import MachineInfo
     from ..environment import Environment
 
-cs_optimization_args = {'0': [],
-                        'g': [],
-                        '1': ['-optimize+'],
-                        '2': ['-optimize+'],
-                        '3': ['-optimize+'],
-                        's': ['-optimize+'],
-                        }  # type: T.Dict[str, T.List[str]]
+_OPTIMIZE = ('-optimize+',)
+
+cs_optimization_args = {'0': (),
+                        'g': (),
+                        '1': _OPTIMIZE,
+                        '2': _OPTIMIZE,
+                        '3': _OPTIMIZE,
+                        's': _OPTIMIZE,
+                        }  # type: T.Dict[str, T.Tuple[str, ...]]
+
+
+_SANITY_SRC = '''
+public class Sanity {
+    static public void Main () {
+    }
+}
+'''
+_SANITY_SRC_BYTES = _SANITY_SRC.encode('utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _absolute_lib_path(build_dir: str, rel_path: str) -> str:
+    # The same -L/-lib: entries show up on many compile lines, so cache
+    # the normalized result instead of recomputing it for each one.
+    return os.path.normpath(os.path.join(build_dir, rel_path))
 
 
 class CsCompiler(BasicLinkerIsCompilerMixin, Compiler):
 
     language = 'cs'
 
+    # These never change for the lifetime of the compiler object, so build
+    # them once instead of on every call.
+    _always_args = ('/nologo',)  # type: T.Tuple[str, ...]
+    _werror_args = ('-warnaserror',)  # type: T.Tuple[str, ...]
+    _debug_args = {False: (), True: ('-debug',)}  # type: T.Dict[bool, T.Tuple[str, ...]]
+
     def __init__(self, exelist: T.List[str], version: str, for_machine: MachineChoice,
                  info: 'MachineInfo', runner: T.Optional[str] = None):
         super().__init__(exelist, version, for_machine, info)
@@ -49,10 +74,10 @@ class CsCompiler(BasicLinkerIsCompilerMixin, Compiler):
         return 'C sharp'
 
     def get_always_args(self) -> T.List[str]:
-        return ['/nologo']
+        return list(self._always_args)
 
     def get_linker_always_args(self) -> T.List[str]:
-        return ['/nologo']
+        return list(self._always_args)
 
     def get_output_args(self, fname: str) -> T.List[str]:
         return ['-out:' + fname]
@@ -61,7 +86,7 @@ class CsCompiler(BasicLinkerIsCompilerMixin, Compiler):
         return ['-r:' + fname]
 
     def get_werror_args(self) -> T.List[str]:
-        return ['-warnaserror']
+        return list(self._werror_args)
 
     def get_pic_args(self) -> T.List[str]:
         return []
@@ -69,10 +94,10 @@ class CsCompiler(BasicLinkerIsCompilerMixin, Compiler):
     def compute_parameters_with_absolute_paths(self, parameter_list: T.List[str],
                                                build_dir: str) -> T.List[str]:
         for idx, i in enumerate(parameter_list):
-            if i[:2] == '-L':
-                parameter_list[idx] = i[:2] + os.path.normpath(os.path.join(build_dir, i[2:]))
-            if i[:5] == '-lib:':
-                parameter_list[idx] = i[:5] + os.path.normpath(os.path.join(build_dir, i[5:]))
+            if i.startswith('-L'):
+                parameter_list[idx] = '-L' + _absolute_lib_path(build_dir, i[2:])
+            elif i.startswith('-lib:'):
+                parameter_list[idx] = '-lib:' + _absolute_lib_path(build_dir, i[5:])
 
         return parameter_list
 
@@ -86,23 +111,17 @@ class CsCompiler(BasicLinkerIsCompilerMixin, Compiler):
         src = 'sanity.cs'
         obj = 'sanity.exe'
         source_name = os.path.join(work_dir, src)
-        with open(source_name, 'w', encoding='utf-8') as ofile:
-            ofile.write(textwrap.dedent('''
-                public class Sanity {
-                    static public void Main () {
-                    }
-                }
-                '''))
-        pc = subprocess.Popen(self.exelist + self.get_always_args() + [src], cwd=work_dir)
-        pc.wait()
+        Path(source_name).write_bytes(_SANITY_SRC_BYTES)
+        pc = subprocess.run(self.exelist + self.get_always_args() + [src], cwd=work_dir,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         if pc.returncode != 0:
             raise EnvironmentException('C# compiler %s can not compile programs.' % self.name_string())
         if self.runner:
             cmdlist = [self.runner, obj]
         else:
             cmdlist = [os.path.join(work_dir, obj)]
-        pe = subprocess.Popen(cmdlist, cwd=work_dir)
-        pe.wait()
+        pe = subprocess.run(cmdlist, cwd=work_dir,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         if pe.returncode != 0:
             raise EnvironmentException('Executables created by Mono compiler %s are not runnable.' % self.name_string())
 
@@ -113,10 +132,10 @@ class CsCompiler(BasicLinkerIsCompilerMixin, Compiler):
         return mono_buildtype_args[buildtype]
 
     def get_debug_args(self, is_debug: bool) -> T.List[str]:
-        return ['-debug'] if is_debug else []
+        return list(self._debug_args[is_debug])
 
     def get_optimization_args(self, optimization_level: str) -> T.List[str]:
-        return cs_optimization_args[optimization_level]
+        return list(cs_optimization_args[optimization_level])
 
 
 class MonoCompiler(CsCompiler):
@@ -135,16 +154,19 @@ class VisualStudioCsCompiler(CsCompiler):
 
     id = 'csc'
 
+    def __init__(self, exelist: T.List[str], version: str, for_machine: MachineChoice,
+                 info: 'MachineInfo', runner: T.Optional[str] = None):
+        super().__init__(exelist, version, for_machine, info, runner=runner)
+        # The platform cannot change after construction, so translate the
+        # buildtype table once instead of rewriting it for every lookup.
+        if self.info.is_windows():
+            self._buildtype_args = mono_buildtype_args
+        else:
+            self._buildtype_args = {k: ['-debug:portable' if f == '-debug' else f for f in v]
+                                    for k, v in mono_buildtype_args.items()}
+
     def get_buildtype_args(self, buildtype: str) -> T.List[str]:
-        res = mono_buildtype_args[buildtype]
-        if not self.info.is_windows():
-            tmp = []
-            for flag in res:
-                if flag == '-debug':
-                    flag = '-debug:portable'
-                tmp.append(flag)
-            res = tmp
-        return res
+        return self._buildtype_args[buildtype]
 
     def rsp_file_syntax(self) -> 'RSPFileSyntax':
         return RSPFileSyntax.MSVC